@@ -1,10 +1,14 @@
 from tracker.db.query_store import QueryStore
 
-QueryStore.save_query(
-    name="Last shutdown(logout) time",
-    query=(
-        "What is last shutdown(logout) time?"
-    ),
-    tags=["lsd"],
-)
+# Add new saved queries here; they are all written in a single transaction.
+_QUERIES = [
+    {
+        "name": "Last shutdown(logout) time",
+        "query": "What is last shutdown(logout) time?",
+        "tags": ["lsd"],
+    },
+]
 
+
+if __name__ == "__main__":
+    QueryStore.save_queries(_QUERIES)
@@ -0,0 +1,35 @@
+"""Console-script entry point for the Activity Tracker.
+
+Installed as the ``tracker`` command via ``[project.scripts]`` in
+``pyproject.toml``; ``run_tracker.py`` is a thin wrapper around :func:`main`.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Start the tracker with basic error handling."""
+    try:
+        from tracker.core.app import ActivityTracker
+
+        print("Starting Activity Tracker...")
+        print("Press Ctrl+C to stop")
+
+        tracker = ActivityTracker()
+        tracker.run()
+
+    except KeyboardInterrupt:
+        print("\nTracker stopped by user.")
+        sys.exit(0)
+    except ImportError as e:
+        print(f"Import Error: {e}")
+        print("Make sure to install the package first:")
+        print("  uv pip install -e .")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error starting tracker: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
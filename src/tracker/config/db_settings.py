@@ -1,3 +1,6 @@
+from functools import cached_property, lru_cache
+from urllib.parse import quote
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -9,6 +12,25 @@ class DBSettings(BaseSettings):
     PG_DATABASE: str = Field("last_tracker_db", env="PG_DATABASE")
     PG_HOST:     str = Field("localhost",     env="PG_HOST")
     PG_PORT:     int = Field(5452,            env="PG_PORT")
+    # Event writer transactions run with ``SET LOCAL synchronous_commit = off``:
+    # COMMIT returns before the WAL record is flushed, so a server crash can lose
+    # the last few hundred milliseconds of tracked events (it never corrupts the
+    # database). Other sessions (QueryStore, user_add) keep the server's setting.
+    PG_WRITER_ASYNC_COMMIT: bool = Field(True, env="PG_WRITER_ASYNC_COMMIT")
+    # The event writer prepares its fixed-shape INSERT/UPDATEs server-side from
+    # their first execution; other queries keep psycopg's default threshold.
+    # Set PG_PREPARE_STATEMENTS=false behind a transaction-pooling pgbouncer,
+    # which cannot route prepared statements.
+    PG_PREPARE_STATEMENTS: bool = Field(True, env="PG_PREPARE_STATEMENTS")
+    # Connection pool. The event writer holds one connection at a time; the rest
+    # is headroom for query/report code sharing the engine.
+    PG_POOL_SIZE:     int = Field(5,    env="PG_POOL_SIZE")
+    PG_MAX_OVERFLOW:  int = Field(10,   env="PG_MAX_OVERFLOW")
+    PG_POOL_TIMEOUT:  float = Field(30, env="PG_POOL_TIMEOUT")
+    PG_POOL_RECYCLE:  int = Field(1800, env="PG_POOL_RECYCLE")
+    # Seconds libpq waits for a connection before giving up, so an unreachable
+    # server fails fast and the event writer can back off and retry.
+    PG_CONNECT_TIMEOUT: int = Field(10, env="PG_CONNECT_TIMEOUT")
 
 
     class Config:
@@ -16,10 +38,48 @@ class DBSettings(BaseSettings):
         case_sensitive = True
         extra = "ignore"
 
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Return a SQLAlchemy-compatible Postgres connection URL."""
-        return f"postgresql+psycopg://{self.PG_USER}:{self.PG_PASS}@{self.PG_HOST}:{self.PG_PORT}/{self.PG_DATABASE}"
+        """Return a SQLAlchemy-compatible Postgres connection URL.
+
+        Built once per settings instance; credentials are percent-encoded so
+        characters such as ``@``, ``/`` or ``:`` in a password stay valid.
+        """
+        user = quote(self.PG_USER, safe="")
+        password = quote(self.PG_PASS, safe="")
+        return f"postgresql+psycopg://{user}:{password}@{self.PG_HOST}:{self.PG_PORT}/{self.PG_DATABASE}"
+
+    @property
+    def connect_args(self) -> dict:
+        """Return DBAPI ``connect()`` keyword arguments for the engine."""
+        args: dict = {"connect_timeout": self.PG_CONNECT_TIMEOUT}
+        if not self.PG_PREPARE_STATEMENTS:
+            args["prepare_threshold"] = None  # psycopg's "never prepare"
+        return args
+
+    @property
+    def pool_args(self) -> dict:
+        """Return the ``create_engine()`` keyword arguments for the connection pool."""
+        return {
+            "pool_size": self.PG_POOL_SIZE,
+            "max_overflow": self.PG_MAX_OVERFLOW,
+            "pool_timeout": self.PG_POOL_TIMEOUT,
+            "pool_recycle": self.PG_POOL_RECYCLE,
+            # Hand out the most recently returned connection, so idle extras
+            # age out via pool_recycle instead of all being kept warm.
+            "pool_use_lifo": True,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_db_settings() -> DBSettings:
+    """Return the process-wide settings, parsing the environment on first use."""
+    return DBSettings()
 
 
-db_settings = DBSettings()
+def __getattr__(name: str):
+    # PEP 562: ``from tracker.config.db_settings import db_settings`` keeps working, but
+    # the settings are only built when first requested, not on module import.
+    if name == "db_settings":
+        return get_db_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
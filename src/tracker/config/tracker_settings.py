@@ -1,5 +1,6 @@
 import getpass
 import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -10,11 +11,12 @@ class TrackerSettings(BaseSettings):
     """Settings controlling the behaviour of the activity tracker client."""
 
     IDLE_THRESHOLD: int = Field(150, description="seconds before user considered idle")
-    HEARTBEAT_EVERY: int = Field(60, description="seconds between heartbeat writes")
+    HEARTBEAT_EVERY: int = Field(60, gt=0, description="seconds between heartbeat writes")
     SCREENSHOT_INTERVAL: int = Field(86400, description="seconds between automatic screenshots (0 = disabled)")
     IMAGE_FORMAT: str = Field("png", description="png | jpeg")
     IMAGE_QUALITY: int = Field(85, description="JPEG quality when IMAGE_FORMAT == 'jpeg'")
     WINDOW_EVENT_INTERVAL: int = Field(5, description="seconds a window must remain active before it is logged")
+    POLL_INTERVAL: float = Field(0.1, gt=0, description="seconds between lock/idle and focused-window polls")
 
     BASE_DIR: Path = Path.cwd() / "tracker"
 
@@ -23,8 +25,9 @@ class TrackerSettings(BaseSettings):
         case_sensitive = True
         extra = "ignore"
 
-    @property
+    @cached_property
     def screenshot_dir(self) -> Path:
+        # Created once; later reads skip the mkdir() syscall.
         path = self.BASE_DIR / "screenshots"
         path.mkdir(parents=True, exist_ok=True)
         return path
@@ -33,8 +36,9 @@ class TrackerSettings(BaseSettings):
     def heartbeat_file(self) -> Path:
         return self.BASE_DIR / "heartbeat.txt"
 
-    @property
+    @cached_property
     def user(self) -> str:
+        # Resolved once per process – every event row embeds the username.
         return getpass.getuser()
 
     @property
@@ -42,4 +46,15 @@ class TrackerSettings(BaseSettings):
         return sys.platform
 
 
-tracker_settings = TrackerSettings()
+@lru_cache(maxsize=1)
+def get_tracker_settings() -> TrackerSettings:
+    """Return the process-wide settings, parsing the environment on first use."""
+    return TrackerSettings()
+
+
+def __getattr__(name: str):
+    # PEP 562: ``from tracker.config.tracker_settings import tracker_settings`` keeps working, but
+    # the settings are only built when first requested, not on module import.
+    if name == "tracker_settings":
+        return get_tracker_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from loguru import logger
 
-from tracker.config.tracker_settings import tracker_settings
 from tracker.db.event_store import EventStore
 from tracker.tables.activity_table import ActivityEventType
 
@@ -13,18 +12,27 @@ from .idle_detector import IdleDetector
 from .screen_lock_detector import ScreenLockDetector
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityStateTask:
+    period: float = 0.1  # seconds until the next lock/idle poll; read by the EventLoop
+    max_backoff: int = 10  # slowest poll is ``max_backoff`` times the base period
+    idle_threshold: float = 150  # seconds without input before the user counts as idle
+    _base_period: float = field(init=False)
+    _backoff: int = 1
     _locked: bool | None = None
     _idle: bool | None = None
-    _idle_detector: IdleDetector = IdleDetector()
-    _lock_detector: ScreenLockDetector = ScreenLockDetector()
+    _next_idle_check: float = 0.0
+    _idle_detector: IdleDetector = field(default_factory=IdleDetector)
+    _lock_detector: ScreenLockDetector = field(default_factory=ScreenLockDetector)
+
+    def __post_init__(self) -> None:
+        self._base_period = self.period
 
     def tick(self, now: float) -> tuple[bool | None, bool | None]:
         """
         Evaluate and log the current activity state based on screen lock and user idle status.
 
-        This method should be called periodically (e.g., in a main loop) with the current UNIX timestamp.
+        This method should be called periodically (e.g., in a main loop) with the current monotonic time.
         It determines whether the screen is locked and whether the user is idle, and logs activity events
         accordingly. The method updates the internal state to reflect the most recent lock and idle status.
 
@@ -32,7 +40,7 @@ class ActivityStateTask:
             - On the first invocation (when internal state is uninitialized):
                 - If the screen is locked, logs a SCREEN_LOCKED event and sets the state to locked and not idle.
                 - If the screen is unlocked, checks idle time:
-                    - Logs INACTIVE if the user is idle (idle time >= IDLE_THRESHOLD).
+                    - Logs INACTIVE if the user is idle (idle time >= idle_threshold).
                     - Logs ACTIVE if the user is not idle.
                     - Sets the state to unlocked and updates idle status.
             - On subsequent invocations:
@@ -42,9 +50,14 @@ class ActivityStateTask:
             - If the screen is unlocked, checks for changes in idle status:
                 - If the user transitions from active to idle, logs an INACTIVE event and updates state.
                 - If the user transitions from idle to active, logs an ACTIVE event and updates state.
+                - While the user is active, the idle probe is skipped until the earliest moment the
+                  idle threshold could be reached (idle_threshold - seconds idle at the last probe).
+            - While neither state changes the poll period doubles, up to ``max_backoff`` times the
+              base period; any transition resets it.
 
         Args:
-            now (float): The current time as a UNIX timestamp (seconds since epoch).
+            now (float): The current reading of the monotonic clock (``time.monotonic()``, seconds).
+                Only used for scheduling; logged events are stamped with wall-clock time.
 
         Returns:
             tuple[bool | None, bool | None]: The current (locked, idle) state after processing.
@@ -56,55 +69,66 @@ class ActivityStateTask:
             - Updates the internal _locked and _idle state variables.
 
         """
-        timestamp = datetime.fromtimestamp(now)
+        previous = (self._locked, self._idle)
+        events: list[ActivityEventType] = []
         locked = self._lock_detector.is_locked()
 
         if self._locked is None:
             if locked:
-                state = ActivityEventType.SCREEN_LOCKED
-                logger.info(f"Logging activity: {state.value}")
-                EventStore.log_activity(state.value, timestamp=timestamp)
+                events.append(ActivityEventType.SCREEN_LOCKED)
                 self._locked = True
                 self._idle = False
             else:
-                idle_seconds = self._idle_detector.seconds_idle()
-                is_idle = idle_seconds >= tracker_settings.IDLE_THRESHOLD
-
-                state = ActivityEventType.INACTIVE if is_idle else ActivityEventType.ACTIVE
-                logger.info(f"Logging activity: {state.value}")
-                EventStore.log_activity(state.value, timestamp=timestamp)
-
+                # The initial ACTIVE/INACTIVE state is decided by the idle
+                # probe below, so the detector is queried only once this tick.
                 self._locked = False
-                self._idle = is_idle
         else:
             if locked and not self._locked:
-                state = ActivityEventType.SCREEN_LOCKED
-                logger.info(f"Logging activity: {state.value}")
-                EventStore.log_activity(state.value, timestamp=timestamp)
+                events.append(ActivityEventType.SCREEN_LOCKED)
                 self._locked, self._idle = True, False
+                self._next_idle_check = 0.0
             elif not locked and self._locked:
-                state = ActivityEventType.SCREEN_UNLOCKED
-                logger.info(f"Logging activity: {state.value}")
-                EventStore.log_activity(state.value, timestamp=timestamp)
+                events.append(ActivityEventType.SCREEN_UNLOCKED)
                 self._locked = False
-                state = ActivityEventType.ACTIVE
-                logger.info(f"Logging activity: {state.value}")
-                EventStore.log_activity(state.value, timestamp=timestamp)
+                events.append(ActivityEventType.ACTIVE)
 
-        if not locked:
+        if not locked and now >= self._next_idle_check:
             idle_seconds = self._idle_detector.seconds_idle()
-            is_idle = idle_seconds >= tracker_settings.IDLE_THRESHOLD
+            is_idle = idle_seconds >= self.idle_threshold
+
+            if not is_idle:
+                # The user cannot cross the idle threshold sooner than this, so
+                # the (often subprocess-backed) idle probe can be skipped until then.
+                self._next_idle_check = now + self.idle_threshold - max(idle_seconds, 0.0)
 
-            if self._idle is not None:
+            if self._idle is None:
+                events.append(ActivityEventType.INACTIVE if is_idle else ActivityEventType.ACTIVE)
+                self._idle = is_idle
+            else:
                 if is_idle and not self._idle:
-                    state = ActivityEventType.INACTIVE
-                    logger.info(f"Logging activity: {state.value}")
-                    EventStore.log_activity(state.value, timestamp=timestamp)
+                    events.append(ActivityEventType.INACTIVE)
                     self._idle = True
                 elif not is_idle and self._idle:
-                    state = ActivityEventType.ACTIVE
-                    logger.info(f"Logging activity: {state.value}")
-                    EventStore.log_activity(state.value, timestamp=timestamp)
+                    events.append(ActivityEventType.ACTIVE)
                     self._idle = False
 
+        if events:
+            # One wall-clock reading per tick, so e.g. SCREEN_UNLOCKED and the
+            # ACTIVE that follows it carry the same timestamp.
+            timestamp = datetime.now()
+            for state in events:
+                self._log_activity(state, timestamp)
+
+        if (self._locked, self._idle) != previous:
+            self._backoff = 1
+        else:
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+        self.period = self._base_period * self._backoff
+
         return self._locked, self._idle
+
+    @staticmethod
+    def _log_activity(state: ActivityEventType, timestamp: datetime) -> None:
+        """Record *state* at *timestamp*."""
+        logger.info("Logging activity: {}", state.value)
+        EventStore.log_activity(state.value, timestamp=timestamp)
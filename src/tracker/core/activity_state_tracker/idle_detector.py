@@ -5,6 +5,7 @@ import ctypes.wintypes
 import subprocess
 
 from tracker.config.tracker_settings import tracker_settings
+from tracker.core.x11_native import get_display
 
 
 class IdleDetector:
@@ -39,6 +40,13 @@ class IdleDetector:
 
     @staticmethod
     def _seconds_idle_linux() -> float:
+        display = get_display()
+        if display is not None:
+            idle = display.seconds_idle()
+            if idle is not None:
+                return idle
+
+        # No X connection or no libXss: fall back to the command-line tools
         for cmd in (["xprintidle"], ["xssstate", "-i"]):
             try:
                 return int(subprocess.check_output(cmd)) / 1000.0
@@ -11,18 +11,48 @@ from tracker.config.tracker_settings import tracker_settings
 class ScreenLockDetector:
     """Naïve cross-platform screen-lock detection."""
 
+    # Session types that belong to a local graphical login (and so can be locked)
+    _GRAPHICAL_TYPES = frozenset({"x11", "wayland", "mir"})
+    # The user's loginctl session once found; see _get_current_session_id
+    _session_id: str | None = None
+
     @staticmethod
     def _get_current_session_id() -> str | None:
-        """Helper for Linux: get the current session id for loginctl."""
+        """Helper for Linux: get the user's graphical session id for loginctl.
+
+        ``$XDG_SESSION_ID`` names it when the tracker runs inside that session.
+        Otherwise the user's sessions are listed and the first one with a seat or
+        a graphical type is taken, since SSH and tty sessions never report a lock.
+        The session does not change while the tracker runs, so a found id is
+        kept; a failed lookup is retried on the next poll.
+        """
+        if ScreenLockDetector._session_id is None:
+            ScreenLockDetector._session_id = (
+                os.environ.get("XDG_SESSION_ID") or ScreenLockDetector._find_graphical_session()
+            )
+        return ScreenLockDetector._session_id
+
+    @staticmethod
+    def _find_graphical_session() -> str | None:
         try:
-            uid = os.getuid()
+            uid = str(os.getuid())
             res = subprocess.run(["loginctl", "list-sessions", "--no-legend"], capture_output=True, check=False)
             for line in res.stdout.decode().splitlines():
+                # SESSION UID USER SEAT ...
                 parts = line.split()
-                if len(parts) >= 2 and parts[2] == str(uid):
+                if len(parts) < 2 or parts[1] != uid:
+                    continue
+                res = subprocess.run(
+                    ["loginctl", "show-session", parts[0], "-p", "Type", "-p", "Seat"],
+                    capture_output=True,
+                    check=False,
+                )
+                props = dict(p.split("=", 1) for p in res.stdout.decode().splitlines() if "=" in p)
+                if props.get("Seat") or props.get("Type") in ScreenLockDetector._GRAPHICAL_TYPES:
                     return parts[0]
         except Exception:
-            return None
+            pass
+        return None
 
     @staticmethod
     def _is_locked_win32() -> bool:
@@ -1,3 +1,4 @@
+import signal
 import time
 from datetime import datetime
 
@@ -5,6 +6,7 @@ from loguru import logger
 
 from tracker.config.tracker_settings import tracker_settings
 from tracker.core import ActivityStateTask, HeartbeatTask, ScreenshotCapturer, WindowTrackerTask
+from tracker.core.event_loop import EventLoop
 from tracker.db.event_store import EventStore
 from tracker.tables.activity_table import ActivityEventType
 
@@ -20,8 +22,8 @@ class ActivityTracker:
         self.capturer = ScreenshotCapturer(self.screenshot_dir)
         self.tasks: list = [
             HeartbeatTask(interval=tracker_settings.HEARTBEAT_EVERY),
-            WindowTrackerTask(interval=tracker_settings.WINDOW_EVENT_INTERVAL),
-            ActivityStateTask(),
+            WindowTrackerTask(interval=tracker_settings.WINDOW_EVENT_INTERVAL, period=tracker_settings.POLL_INTERVAL),
+            ActivityStateTask(period=tracker_settings.POLL_INTERVAL, idle_threshold=tracker_settings.IDLE_THRESHOLD),
         ]
 
     def run(self) -> None:
@@ -30,25 +32,33 @@ class ActivityTracker:
 
         # Abort early if the platform isn't supported
         if tracker_settings.system not in self.SUPPORTED_SYSTEMS:
-            logger.error(f"Unsupported system: {tracker_settings.system}")
+            logger.error("Unsupported system: {}", tracker_settings.system)
             return
 
         # Log the start of the activity tracker
         start_time = time.time()
         status = ActivityEventType.STARTED.value
-        logger.info(f"Logging activity: {status}")
+        logger.info("Logging activity: {}", status)
         self.event_store.log_activity(status, timestamp=datetime.fromtimestamp(start_time))
 
+        loop = EventLoop(self.tasks)
+        # SIGTERM (service stop, logout) ends the loop cleanly so the STOPPED
+        # event below is still written; the wake-up fd makes this immediate.
+        previous_sigterm = signal.signal(signal.SIGTERM, lambda *_: loop.stop())
+
         try:
-            while True:
-                now = time.time()
-                for t in self.tasks:
-                    t.tick(now)
-                time.sleep(0.1)  # Prevent high CPU usage
+            loop.run()
 
         finally:
+            signal.signal(signal.SIGTERM, previous_sigterm)
+
             # Log the stop of the activity tracker
             stop_time = time.time()
             status = ActivityEventType.STOPPED.value
-            logger.info(f"Logging activity: {status}")
+            logger.info("Logging activity: {}", status)
             self.event_store.log_activity(status, timestamp=datetime.fromtimestamp(stop_time))
+
+            self.capturer.close()
+
+            # Give the writer a bounded window to persist what is still queued
+            self.event_store.close(timeout=2.0)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import heapq
+import selectors
+import signal
+import socket
+import time
+from typing import Iterable
+
+
+class EventLoop:
+    """Run periodic tasks on absolute deadlines of the monotonic clock.
+
+    Each task must expose a ``period`` (seconds between ticks) and a ``tick(now)``
+    method. Tasks are kept in a min-heap of ``(next_due, index, task)``; the loop
+    blocks in ``selector.select(timeout)`` until the earliest one is due, so the
+    process only wakes when there is work to do. Tasks therefore need no timing
+    gate of their own: a task with a 60 s period is woken once a minute.
+
+    Signals are routed through :func:`signal.set_wakeup_fd` into a socket that is
+    registered with the selector. A handler that calls :meth:`stop` therefore
+    wakes the loop immediately instead of after the current timeout expires.
+    """
+
+    def __init__(self, tasks: Iterable) -> None:
+        self._tasks = list(tasks)
+        for task in self._tasks:
+            # The catch-up arithmetic in run() divides by the period.
+            if not task.period > 0:
+                raise ValueError(f"{type(task).__name__}.period must be > 0, got {task.period!r}")
+        self._running = False
+
+    def stop(self) -> None:
+        """Ask the loop to return; safe to call from a signal handler."""
+        self._running = False
+
+    def run(self) -> None:
+        """Tick every task once immediately, then on its own period until :meth:`stop`."""
+        selector = selectors.DefaultSelector()
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        wake_w.setblocking(False)
+        selector.register(wake_r, selectors.EVENT_READ)
+
+        try:
+            previous_wakeup_fd = signal.set_wakeup_fd(wake_w.fileno(), warn_on_full_buffer=False)
+        except ValueError:  # Not the main thread – signals cannot reach us anyway
+            previous_wakeup_fd = None
+
+        first_due = time.monotonic()
+        schedule = [(first_due, i, t) for i, t in enumerate(self._tasks)]
+        heapq.heapify(schedule)
+
+        self._running = True
+        try:
+            while self._running:
+                due, i, task = schedule[0]
+                timeout = due - time.monotonic()
+                if timeout > 0:
+                    if selector.select(timeout):
+                        # Woken by a signal: drain the wake-up bytes.
+                        self._drain(wake_r)
+                    # Re-check stop() and the deadline before ticking.
+                    continue
+
+                task.tick(time.monotonic())
+
+                # Absolute deadlines (first_due + k * period) avoid drift. If we
+                # fell behind, skip the missed slots instead of firing a burst of
+                # catch-up ticks, but stay on the same grid so that e.g.
+                # heartbeats keep their phase.
+                period = task.period
+                next_due = due + period
+                behind = time.monotonic() - next_due
+                if behind >= 0:
+                    next_due += (behind // period + 1) * period
+                heapq.heapreplace(schedule, (next_due, i, task))
+        finally:
+            if previous_wakeup_fd is not None:
+                signal.set_wakeup_fd(previous_wakeup_fd)
+            selector.close()
+            wake_r.close()
+            wake_w.close()
+
+    @staticmethod
+    def _drain(sock: socket.socket) -> None:
+        try:
+            while sock.recv(512):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
@@ -6,50 +6,39 @@ from datetime import datetime
 from tracker.db.event_store import EventStore
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatTask:
     """
-    Periodically logs a heartbeat event at a specified interval.
+    Logs a heartbeat event every time it is ticked.
 
-    This class manages the timing and execution of heartbeat events, ensuring that a heartbeat
-    is logged to the EventStore only when the configured interval has elapsed since the last event.
-    It tracks the last time a heartbeat was logged and provides a method to trigger a new event
-    if appropriate.
+    The cadence is owned by the ``EventLoop``, which ticks this task
+    every ``period`` (== ``interval``) seconds on absolute deadlines. The task itself therefore
+    keeps no timing state; re-checking the elapsed wall-clock time here would only drop beats
+    whenever a wake-up happened a few microseconds early.
 
     Attributes:
-        interval (int): The minimum number of seconds between consecutive heartbeat events.
-        _last (float | None): The UNIX timestamp of the last heartbeat event, or None if no event has been logged yet.
+        interval (int): The number of seconds between consecutive heartbeat events.
 
     Methods:
         tick(now: float) -> None:
-            Checks if the interval has elapsed since the last heartbeat. If so, logs a new
-            heartbeat event and updates the last event timestamp.
+            Logs a heartbeat event stamped with the current wall-clock time.
     """
 
     interval: int
-    _last: float | None = None
+
+    @property
+    def period(self) -> float:
+        """Seconds between scheduled ticks."""
+        return self.interval
 
     def tick(self, now: float) -> None:
         """
-        Log a heartbeat event if the configured interval has elapsed since the last event, or if this is the first run.
-
-        This method should be called periodically (e.g., in a main loop) with the current UNIX timestamp.
-        It checks whether the specified interval has passed since the last heartbeat event was logged.
-        If so, or if this is the first invocation (i.e., no previous heartbeat has been logged), it logs a new
-        heartbeat event to the EventStore with the status "Alive" and updates the internal timestamp.
+        Log a heartbeat event.
 
         Args:
-            now (float): The current time as a UNIX timestamp (seconds since epoch).
-
-        Behavior:
-            - On the first invocation (when _last is None), logs a heartbeat event immediately.
-            - On subsequent invocations, logs a heartbeat event only if at least `interval` seconds have passed
-              since the last logged heartbeat.
+            now (float): The current reading of the monotonic clock (``time.monotonic()``, seconds). Unused; the row is stamped with wall-clock time.
 
         Side Effects:
-            - Updates the internal _last timestamp to the current time if a heartbeat is logged.
             - Calls EventStore.heartbeat to record the heartbeat event with the current timestamp.
         """
-        if self._last is None or now - self._last >= self.interval:
-            self._last = now
-            EventStore.heartbeat(timestamp=datetime.fromtimestamp(timestamp=now))
+        EventStore.heartbeat(timestamp=datetime.now())
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import mss
+from loguru import logger
 from PIL import Image
 
 from tracker.config.tracker_settings import tracker_settings
@@ -16,10 +18,28 @@ class ScreenshotCapturer:
     and Linux.  If *mss* fails (e.g. missing X server on a head-less Linux box or the
     user hasn’t granted macOS screen-recording permission yet) platform-specific
     fall-backs are attempted so that we at least save a screenshot when possible.
+
+    Only the grab happens on the caller's thread; encoding and writing the files
+    (the slow part for large monitors) runs on a single background worker, so a
+    capture does not stall the event loop. Call :meth:`close` on shutdown to wait
+    for pending writes.
+
+    The *mss* instance (an open display / GDI handle) is created on the first
+    capture and reused afterwards. *mss* is not thread-safe, so captures must
+    always come from the same thread – in practice the event loop's.
     """
 
     def __init__(self, screenshot_dir: Path) -> None:
         self._dir = screenshot_dir
+        self._pool: ThreadPoolExecutor | None = None
+        self._sct: mss.base.MSSBase | None = None
+
+    def close(self) -> None:
+        """Release the capture handle, wait for queued screenshots to be written and stop the worker."""
+        self._close_sct()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
     def capture_all_monitors(self) -> None:
         """Capture all monitors for the current platform.
@@ -45,22 +65,48 @@ class ScreenshotCapturer:
                 raise  # Unreachable since checked at app.py
 
     def _save_image(self, img: Image.Image, monitor_idx: int) -> None:
-        """Helper to save *img* into *screenshot_dir* with timestamp naming."""
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """Queue *img* to be saved into *screenshot_dir* with timestamp naming."""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")  # time of the grab, not of the write
         fname = self._dir / f"monitor{monitor_idx}_{stamp}.{tracker_settings.IMAGE_FORMAT}"
 
-        if tracker_settings.IMAGE_FORMAT.lower() == "jpeg":
-            img.save(fname, quality=tracker_settings.IMAGE_QUALITY)
-        else:
-            img.save(fname)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
+        self._pool.submit(self._write_image, img, fname)
+
+    @staticmethod
+    def _write_image(img: Image.Image, fname: Path) -> None:
+        """Encode *img* and write it to *fname*; runs on the background worker."""
+        try:
+            if tracker_settings.IMAGE_FORMAT.lower() == "jpeg":
+                img.save(fname, quality=tracker_settings.IMAGE_QUALITY)
+            else:
+                img.save(fname)
+        except Exception:
+            logger.exception("Failed to write screenshot {}", fname)
+
+    def _close_sct(self) -> None:
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
 
     def _capture_with_mss(self) -> None:
         """Primary implementation using *mss* – works on all major platforms."""
-        with mss.mss() as sct:
+        if self._sct is None:
+            self._sct = mss.mss()
+        sct = self._sct
+        try:
             for i, mon in enumerate(sct.monitors[1:], 1):  # skip the "all" monitor 0
                 shot = sct.grab(mon)
-                img = Image.frombytes("RGB", shot.size, shot.rgb)
+                # Decode mss's BGRA buffer straight into the image; this skips the
+                # intermediate full-frame RGB copy that ``shot.rgb`` would build.
+                # (Pillow still copies: "BGRX" is not a zero-copy frombuffer mode.)
+                img = Image.frombuffer("RGB", shot.size, shot.raw, "raw", "BGRX", 0, 1)
                 self._save_image(img, i)
+        except Exception:
+            # Start from a fresh handle next time (display restarted, monitors
+            # re-plugged, ...); the monitor list is only read once per handle.
+            self._close_sct()
+            raise
 
     def _capture_win32(self) -> None:
         """Fallback for Windows using Pillow’s *ImageGrab* API. Takes whole screen."""
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from loguru import logger
 
@@ -10,11 +10,19 @@ from tracker.db.event_store import EventStore
 from .window_title_provider import WindowTitleProvider
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowTrackerTask:
     _last_title: str | None = None
-    _window_start: float | None = None
+    _window_start: float | None = None  # monotonic; used for the duration
+    _window_started_at: datetime | None = None  # wall clock; used for the DB row
     interval: int = 0
+    period: float = 0.1  # seconds until the next poll; read by the EventLoop
+    max_backoff: int = 10  # slowest poll is ``max_backoff`` times the base period
+    _base_period: float = field(init=False)
+    _backoff: int = 1
+
+    def __post_init__(self) -> None:
+        self._base_period = self.period
 
     def tick(self, now: float) -> None:
         """
@@ -24,13 +32,21 @@ class WindowTrackerTask:
         to a different window, if the previous window was focused for at
         least the configured interval duration.
 
+        While the title stays the same the poll period doubles, up to
+        ``max_backoff`` times the base period; a change snaps it back so the
+        next switch is caught quickly.
+
         Args:
-            now: Current time as UNIX timestamp (seconds since epoch)
+            now: Current monotonic time (``time.monotonic()``, seconds)
         """
         current_title = WindowTitleProvider.current_title()
 
         if self._has_window_changed(current_title):
             self._handle_window_change(current_title, now)
+            self._backoff = 1
+        else:
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+        self.period = self._base_period * self._backoff
 
     def _has_window_changed(self, current_title: str) -> bool:
         """Check if the focused window has changed since last tick."""
@@ -39,39 +55,45 @@ class WindowTrackerTask:
     def _handle_window_change(self, new_title: str, now: float) -> None:
         """Handle when user switches to a different window."""
         self._log_previous_window_if_needed(now)
-        self._start_tracking_new_window(new_title, now)
+        self._start_tracking_new_window(new_title, now, datetime.now())
 
     def _log_previous_window_if_needed(self, now: float) -> None:
         """Log the previous window if it was focused long enough."""
         if self._should_log_previous_window(now):
             duration = now - self._window_start
-            start_timestamp = datetime.fromtimestamp(self._window_start)
-            end_timestamp = datetime.fromtimestamp(now)
+            start_timestamp = self._window_started_at
+            end_timestamp = start_timestamp + timedelta(seconds=duration)
 
             logger.info(
-                f"Window '{self._last_title}' met duration threshold | "
-                f"Start: {start_timestamp.isoformat()} | "
-                f"End: {end_timestamp.isoformat()} | "
-                f"Duration: {duration:.1f}s (>= {self.interval}s threshold)"
+                "Window '{}' met duration threshold | Start: {} | End: {} | Duration: {:.1f}s (>= {}s threshold)",
+                self._last_title,
+                start_timestamp.isoformat(),
+                end_timestamp.isoformat(),
+                duration,
+                self.interval,
             )
 
-            self._log_window_event(self._last_title, self._window_start, duration)
+            self._log_window_event(self._last_title, start_timestamp, end_timestamp, duration)
 
     def _should_log_previous_window(self, now: float) -> bool:
         """Check if the previous window should be logged."""
         return self._last_title is not None and self._window_start is not None and now - self._window_start >= self.interval
 
-    def _start_tracking_new_window(self, window_title: str, now: float) -> None:
+    def _start_tracking_new_window(self, window_title: str, now: float, started_at: datetime) -> None:
         """Begin tracking a new window focus session."""
         self._last_title = window_title
         self._window_start = now
-        logger.debug(f"Started tracking window: '{window_title}'")
+        self._window_started_at = started_at
+        logger.debug("Started tracking window: '{}'", window_title)
 
-    def _log_window_event(self, window_title: str, start_time: float, duration: float) -> None:
+    def _log_window_event(self, window_title: str, start_time: datetime, end_time: datetime, duration: float) -> None:
         """Log a window event to the database with start and end timestamps."""
-        start_timestamp = datetime.fromtimestamp(start_time)
-        end_timestamp = datetime.fromtimestamp(start_time + duration)
-
-        logger.info(f"Logging window event for '{window_title}' | Start: {start_timestamp.isoformat()} | End: {end_timestamp.isoformat()} | Duration: {duration:.1f}s")
-
-        EventStore.log_window_event(window_title, start_time=start_timestamp, end_time=end_timestamp)
+        logger.info(
+            "Logging window event for '{}' | Start: {} | End: {} | Duration: {:.1f}s",
+            window_title,
+            start_time.isoformat(),
+            end_time.isoformat(),
+            duration,
+        )
+
+        EventStore.log_window_event_range(window_title, start_time, end_time)
@@ -5,6 +5,7 @@ import ctypes.wintypes
 import subprocess
 
 from tracker.config.tracker_settings import tracker_settings
+from tracker.core.x11_native import get_display
 
 
 class WindowTitleProvider:
@@ -39,6 +40,13 @@ class WindowTitleProvider:
 
     @staticmethod
     def _current_title_linux() -> str:
+        display = get_display()
+        if display is not None:
+            title = display.active_window_title()
+            if title is not None:
+                return title or "N/A"
+
+        # No X connection or no EWMH support: fall back to xdotool
         try:
             win_id = subprocess.check_output(["xdotool", "getwindowfocus"]).strip()
             title = subprocess.check_output(["xdotool", "getwindowname", win_id]).decode().strip()
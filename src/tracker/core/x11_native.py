@@ -0,0 +1,263 @@
+"""Minimal ctypes bindings to Xlib for the Linux probes.
+
+The Linux implementations of the window-title and idle probes used to spawn
+``xdotool``/``xprintidle`` on every poll. This module keeps one ``Display``
+connection open for the life of the process and answers the same questions
+with a couple of X requests instead of a fork+exec. The active window title
+is additionally cached and only re-read after the X server reports a
+property change.
+
+Everything degrades to ``None`` – no ``DISPLAY`` (e.g. a pure Wayland session),
+libX11 missing, or a property the window manager does not maintain – so
+callers can fall back to their subprocess implementation.
+
+If the connection is lost (X server restart, logout), Xlib would normally call
+``exit()`` from its IO error handler. With libX11 >= 1.7 an IO error exit
+handler is installed instead: the display is marked broken, calls return
+``None`` and :func:`get_display` opens a new connection (at most every few
+seconds). Older libX11 lacks ``XSetIOErrorExitHandler``; there a lost
+connection still ends the process.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import time
+from functools import cache
+
+_AnyPropertyType = 0
+_XA_WM_NAME = 39
+_Success = 0
+_NoEventMask = 0
+_PropertyChangeMask = 1 << 22
+
+# Xlib's default error handler prints and *exits the process*; a BadWindow from
+# a window closed between two requests must not take the tracker down with it.
+_XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+_ignore_x_errors = _XErrorHandler(lambda _display, _event: 0)
+
+# Display pointers whose connection hit an IO error; never used again.
+_broken: set[int] = set()
+
+
+def _on_io_error(display: int, *_: object) -> int:
+    _broken.add(display)
+    return 0
+
+
+_XIOErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p)
+_XIOErrorExitHandler = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)
+_record_io_error = _XIOErrorHandler(_on_io_error)
+_survive_io_error = _XIOErrorExitHandler(_on_io_error)  # returning instead of exit()ing
+
+_REOPEN_INTERVAL = 5.0  # seconds between attempts to (re)open the display
+
+
+class _XScreenSaverInfo(ctypes.Structure):
+    _fields_ = [
+        ("window", ctypes.c_ulong),
+        ("state", ctypes.c_int),
+        ("kind", ctypes.c_int),
+        ("til_or_since", ctypes.c_ulong),
+        ("idle", ctypes.c_ulong),
+        ("eventMask", ctypes.c_ulong),
+    ]
+
+
+class X11Display:
+    """A long-lived connection to the X server named by ``$DISPLAY``."""
+
+    def __init__(self, lib: ctypes.CDLL, display: int, xss: ctypes.CDLL | None = None) -> None:
+        self._lib = lib
+        self._xss = xss
+        self._display = display
+        self._root = lib.XDefaultRootWindow(display)
+        self._net_active_window = self._atom(b"_NET_ACTIVE_WINDOW")
+        self._net_wm_name = self._atom(b"_NET_WM_NAME")
+        self._utf8_string = self._atom(b"UTF8_STRING")
+
+        # The title is re-read only after a PropertyNotify: on the root window
+        # for _NET_ACTIVE_WINDOW, on the active window for its name.
+        self._event = (ctypes.c_long * 24)()  # sizeof(XEvent)
+        self._watched = 0
+        self._title: str | None = None
+        lib.XSelectInput(display, self._root, _PropertyChangeMask)
+
+    @property
+    def broken(self) -> bool:
+        """Whether the connection to the X server has been lost."""
+        return self._display in _broken
+
+    def _atom(self, name: bytes) -> int:
+        return self._lib.XInternAtom(self._display, name, False)
+
+    def _property(self, window: int, prop: int, req_type: int = _AnyPropertyType) -> tuple[int, bytes] | None:
+        """Return ``(format, raw bytes)`` of *prop* on *window*, or ``None``."""
+        actual_type = ctypes.c_ulong()
+        actual_format = ctypes.c_int()
+        nitems = ctypes.c_ulong()
+        bytes_after = ctypes.c_ulong()
+        data = ctypes.c_void_p()
+        status = self._lib.XGetWindowProperty(
+            self._display, window, prop, 0, 1024, False, req_type,
+            ctypes.byref(actual_type), ctypes.byref(actual_format),
+            ctypes.byref(nitems), ctypes.byref(bytes_after), ctypes.byref(data),
+        )
+        if status != _Success or not data.value:
+            return None
+        try:
+            if not nitems.value:
+                return None
+            # Format-32 items are C longs on the client side, whatever their width.
+            item_size = ctypes.sizeof(ctypes.c_ulong) if actual_format.value == 32 else actual_format.value // 8
+            return actual_format.value, ctypes.string_at(data, nitems.value * item_size)
+        finally:
+            self._lib.XFree(data)
+
+    def _drain_events(self) -> bool:
+        """Discard queued X events; ``True`` if there were any."""
+        if not self._lib.XPending(self._display):
+            return False
+        while not self.broken and self._lib.XPending(self._display):
+            self._lib.XNextEvent(self._display, self._event)
+        return True
+
+    def _watch(self, window: int) -> None:
+        if window == self._watched:
+            return
+        if self._watched:
+            self._lib.XSelectInput(self._display, self._watched, _NoEventMask)
+        self._lib.XSelectInput(self._display, window, _PropertyChangeMask)
+        self._watched = window
+
+    def active_window_title(self) -> str | None:
+        """Title of the EWMH active window, or ``None`` if it cannot be read.
+
+        Served from cache until a property change has been reported since the
+        last read, so a steady state costs one non-blocking socket check.
+        """
+        if self.broken:
+            return None
+        if self._drain_events() or self._title is None:
+            self._title = None if self.broken else self._read_active_window_title()
+        if self.broken:  # the connection died during this call
+            self._title = None
+        return self._title
+
+    def _read_active_window_title(self) -> str | None:
+        active = self._property(self._root, self._net_active_window)
+        if active is None or active[0] != 32:
+            return None
+        window = ctypes.c_ulong.from_buffer_copy(active[1]).value
+        if not window:
+            return None
+        self._watch(window)
+
+        name = self._property(window, self._net_wm_name, self._utf8_string) or self._property(window, _XA_WM_NAME)
+        if name is None:
+            return ""
+        return name[1].decode("utf-8", errors="replace")
+
+    def seconds_idle(self) -> float | None:
+        """Seconds since the last user input, or ``None`` if the MIT-SCREEN-SAVER
+        extension (libXss) is unavailable."""
+        if self._xss is None or self.broken:
+            return None
+        info = _XScreenSaverInfo()
+        if not self._xss.XScreenSaverQueryInfo(self._display, self._root, ctypes.byref(info)) or self.broken:
+            return None
+        return info.idle / 1000.0
+
+
+_display: X11Display | None = None
+_next_open = 0.0
+
+
+def get_display() -> X11Display | None:
+    """Return the shared X connection, opening it on first use; ``None`` when X is unavailable.
+
+    A connection lost to an IO error is replaced by a new one; opening is
+    attempted at most every ``_REOPEN_INTERVAL`` seconds.
+    """
+    global _display, _next_open
+    if _display is not None and not _display.broken:
+        return _display
+    _display = None
+
+    lib = _load_x11()
+    if lib is None:
+        return None
+    now = time.monotonic()
+    if now < _next_open:
+        return None
+    _next_open = now + _REOPEN_INTERVAL
+
+    display = lib.XOpenDisplay(None)
+    if not display:
+        return None
+    if hasattr(lib, "XSetIOErrorExitHandler"):
+        lib.XSetIOErrorExitHandler(display, _survive_io_error, None)
+    _display = X11Display(lib, display, _load_xss())
+    return _display
+
+
+@cache
+def _load_x11() -> ctypes.CDLL | None:
+    if not os.environ.get("DISPLAY"):
+        return None
+    path = ctypes.util.find_library("X11")
+    if path is None:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+
+    lib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    lib.XOpenDisplay.restype = ctypes.c_void_p
+    lib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    lib.XDefaultRootWindow.restype = ctypes.c_ulong
+    lib.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    lib.XInternAtom.restype = ctypes.c_ulong
+    lib.XGetWindowProperty.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_long, ctypes.c_long, ctypes.c_int, ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_void_p),
+    ]
+    lib.XGetWindowProperty.restype = ctypes.c_int
+    lib.XFree.argtypes = [ctypes.c_void_p]
+    lib.XFree.restype = ctypes.c_int
+    lib.XSelectInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_long]
+    lib.XSelectInput.restype = ctypes.c_int
+    lib.XPending.argtypes = [ctypes.c_void_p]
+    lib.XPending.restype = ctypes.c_int
+    lib.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    lib.XNextEvent.restype = ctypes.c_int
+    lib.XSetErrorHandler.argtypes = [_XErrorHandler]
+    lib.XSetErrorHandler.restype = ctypes.c_void_p
+    lib.XSetIOErrorHandler.argtypes = [_XIOErrorHandler]
+    lib.XSetIOErrorHandler.restype = ctypes.c_void_p
+    if hasattr(lib, "XSetIOErrorExitHandler"):  # libX11 >= 1.7
+        lib.XSetIOErrorExitHandler.argtypes = [ctypes.c_void_p, _XIOErrorExitHandler, ctypes.c_void_p]
+        lib.XSetIOErrorExitHandler.restype = None
+
+    # Both handlers are process-wide: install them once, not per connection.
+    lib.XSetErrorHandler(_ignore_x_errors)
+    lib.XSetIOErrorHandler(_record_io_error)
+    return lib
+
+
+@cache
+def _load_xss() -> ctypes.CDLL | None:
+    path = ctypes.util.find_library("Xss")
+    if path is None:
+        return None
+    try:
+        xss = ctypes.CDLL(path)
+    except OSError:
+        return None
+    xss.XScreenSaverQueryInfo.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XScreenSaverInfo)]
+    xss.XScreenSaverQueryInfo.restype = ctypes.c_int
+    return xss
@@ -1,21 +1,69 @@
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
 
-from tracker.config.db_settings import db_settings
+from tracker.config.db_settings import get_db_settings
 from tracker.tables.activity_table import ActivityEvent
 from tracker.tables.heartbeat_table import HeartbeatEvent
 from tracker.tables.window_event_table import WindowEvent
 from tracker.tables.working_sessions_table import WorkingSession
-from tracker.tables.adk_query_table import AdkQuery
+from tracker.tables.adk_query_table import AdkQuery, AdkQueryTag
 from tracker.tables.people_table import Person_Usernames
 
-_engine = create_engine(db_settings.database_url, echo=False)
-SQLModel.metadata.create_all(_engine)
+# Gives saved queries written before AdkQueryTag existed their tag rows, so tag
+# searches find them without re-saving. Only queries with no tag rows at all are
+# touched, which makes it a no-op once every query has been backfilled or saved.
+_BACKFILL_QUERY_TAGS = text(
+    """
+    INSERT INTO adkquerytag (query_id, tag)
+    SELECT DISTINCT q.id, lower(trim(t))
+    FROM adkquery AS q, unnest(string_to_array(q.tags, ',')) AS t
+    WHERE trim(t) <> ''
+      AND NOT EXISTS (SELECT 1 FROM adkquerytag AS a WHERE a.query_id = q.id)
+    ON CONFLICT DO NOTHING
+    """
+)
+
+
+@lru_cache(maxsize=1)
+def _init_engine() -> Engine:
+    """Create the process-wide engine and the schema, once, on first use.
+
+    Importing this module therefore no longer connects to Postgres; the
+    ``CREATE TABLE IF NOT EXISTS`` round trips, and the backfill of missing
+    saved-query tag rows, run the first time a session is opened.
+    """
+    db_settings = get_db_settings()
+    engine = create_engine(
+        db_settings.database_url,
+        echo=False,
+        connect_args=db_settings.connect_args,
+        # The tracker runs for days: test pooled connections before use and
+        # replace them periodically (PG_POOL_RECYCLE) so a Postgres restart or an
+        # idle timeout on the way does not surface as a failed batch.
+        pool_pre_ping=True,
+        **db_settings.pool_args,
+    )
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(_BACKFILL_QUERY_TAGS)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker[Session]:
+    # Nothing re-reads rows after commit; keep loaded attributes instead of
+    # expiring them, which would turn any later access into a SELECT. Autoflush
+    # is off as well: the write paths issue Core statements or flush explicitly
+    # where they need generated keys, so queries never trigger a hidden flush.
+    return sessionmaker(_init_engine(), class_=Session, expire_on_commit=False, autoflush=False)
 
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
-    with Session(_engine) as session:
+    with _session_factory()() as session:
         yield session
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import cache, partial
 
-from sqlmodel import SQLModel, select
+from sqlalchemy import event, exists, func, insert, literal, update
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, SQLModel, select
 
-from tracker.config.tracker_settings import tracker_settings
-from tracker.db.connect import get_session
+from tracker.config.tracker_settings import get_tracker_settings
+from tracker.db.event_writer import EventWriter
 from tracker.tables.activity_table import ActivityEvent, ActivityEventType
 from tracker.tables.heartbeat_table import HeartbeatEvent
 from tracker.tables.window_event_table import WindowEvent
 from tracker.tables.working_sessions_table import WorkingSession
 
+_writer = EventWriter()
+
+
+@cache
+def _user() -> str:
+    """The OS user stamped on every row; it does not change while the tracker runs.
+
+    Resolved on first use, not on import, so importing this module does not
+    build the settings.
+    """
+    return get_tracker_settings().user
+
+
+# Work with *str* values to avoid mixing *str* and *StrEnum* during downstream
+# comparisons. Resolved once here rather than on every activity event.
+_ACTIVE = ActivityEventType.ACTIVE.value
+_STARTED = ActivityEventType.STARTED.value
+_END_LABELS = frozenset({ActivityEventType.INACTIVE.value, ActivityEventType.SCREEN_LOCKED.value})
+_SESSION_LABELS = _END_LABELS | {_ACTIVE, _STARTED}
+
+# The writer never loads WorkingSession objects, so there is nothing for an ORM
+# UPDATE to synchronise (and no reason to fetch the matched ids back).
+_NO_SYNC = {"synchronize_session": False}
+
 
 class EventStore:
     """Database event storage interface for the tracker system.
@@ -20,6 +47,11 @@ class EventStore:
     the tracking components and the underlying database storage, handling session
     management and data persistence automatically.
 
+    Event rows and working-session updates are handed to a background
+    :class:`EventWriter`, which applies them in batches, so none of the public
+    methods block on the database. Call :meth:`close` on shutdown to write
+    whatever is still queued.
+
     This class manages four main types of events:
     - Activity events (active/inactive/started/screen_locked states)
     - Heartbeat events (periodic status updates)
@@ -28,75 +60,104 @@ class EventStore:
 
     """
 
+    # Whether the user has an open WorkingSession as of the last successful commit
+    # (None until first learned). Lets repeated Active/Inactive events skip their
+    # statement. Only touched on the writer thread.
+    _has_open_session: bool | None = None
+
+    @staticmethod
+    def _insert(model: type[SQLModel], values: dict) -> None:
+        _writer.put(model, values)
+
     @staticmethod
-    def _insert(row: SQLModel) -> None:
-        with get_session() as session:
-            session.add(row)
-            session.commit()
+    def close(timeout: float | None = None) -> None:
+        """Write all queued events and stop the writer, waiting at most *timeout* seconds."""
+        _writer.close(timeout)
 
     @staticmethod
-    def _handle_working_session(label: str, ts: datetime) -> None:
+    def _handle_working_session(session: Session, label: str, ts: datetime) -> None:
         """Create or update *WorkingSession* rows based on activity events.
 
         Rules:
         - On **Active**: start a new session unless one is already open.
-        - On **Inactive**: close the most recent open session.
+        - On **Inactive**/**Screen Locked**: close the open session.
         - On **Started**: close any lingering open session from the previous run
           using the timestamp of the last heartbeat between the *Active* and
           the *Started* events (or *ts* itself if no heartbeat exists).
+
+        Runs on the writer thread inside the batch's transaction; the writer
+        commits.
         """
-        # Work with *str* values to avoid mixing *str* and *StrEnum* during
-        # downstream comparisons.  Using the ``.value`` attribute keeps the
-        # behaviour identical to the original implementation that relied on
-        # raw strings only.
-
-        ACTIVE = ActivityEventType.ACTIVE.value
-        INACTIVE = ActivityEventType.INACTIVE.value
-        STARTED = ActivityEventType.STARTED.value
-        SCREEN_LOCKED = ActivityEventType.SCREEN_LOCKED.value
-
-        with get_session() as session:
-            # The most recent open session (if any)
-            open_session = session.exec(
-                select(WorkingSession)
+        if label not in _SESSION_LABELS:
+            # Stopped, Screen Unlocked, ... never touch working sessions
+            return
+
+        user = _user()
+        is_open = (WorkingSession.username == user) & WorkingSession.end_time.is_(None)
+
+        # State as seen by this transaction; published on commit, dropped on rollback.
+        if "has_open_session" not in session.info:
+            session.info["has_open_session"] = EventStore._has_open_session
+            event.listen(session, "after_commit", EventStore._publish_open_session_state, once=True)
+        has_open = session.info["has_open_session"]
+
+        if label in _END_LABELS:
+            if has_open is not False:
+                # Close in place; no need to load the row first.
+                session.exec(
+                    update(WorkingSession).where(is_open).values(end_time=ts, end_reason=label),
+                    execution_options=_NO_SYNC,
+                )
+            session.info["has_open_session"] = False
+        elif label == _ACTIVE:
+            if has_open is True:
+                return
+            # INSERT ... SELECT ... WHERE NOT EXISTS (open session): the
+            # existence check and the insert are one statement.
+            session.exec(
+                insert(WorkingSession).from_select(
+                    ["username", "start_time"],
+                    select(
+                        literal(user, WorkingSession.username.type),
+                        literal(ts, WorkingSession.start_time.type),
+                    ).where(~exists().where(is_open)),
+                )
+            )
+            session.info["has_open_session"] = True
+        elif label == _STARTED:
+            session.info["has_open_session"] = False
+            if has_open is False:
+                return
+            # Close the most recent open session (if any) at the time of the last
+            # heartbeat between its start and *ts*, or at *ts* if there is none.
+            # One correlated UPDATE; the row is never loaded into the session.
+            latest_open = aliased(WorkingSession)
+            last_hb_ts = (
+                select(func.max(HeartbeatEvent.timestamp))
                 .where(
-                    WorkingSession.username == tracker_settings.user,
-                    WorkingSession.end_time.is_(None),
+                    HeartbeatEvent.username == user,
+                    HeartbeatEvent.timestamp > WorkingSession.start_time,
+                    HeartbeatEvent.timestamp < ts,
                 )
-                .order_by(WorkingSession.start_time.desc())
-            ).first()
-
-            if label == ACTIVE:
-                if open_session is None:
-                    session.add(
-                        WorkingSession(
-                            username=tracker_settings.user,
-                            start_time=ts,
-                        )
-                    )
-            elif label in {INACTIVE, SCREEN_LOCKED}:
-                if open_session is not None:
-                    open_session.end_time = ts
-                    open_session.end_reason = label
-                    session.add(open_session)
-            elif label == STARTED:
-                if open_session is not None:
-                    # Find the last heartbeat between *open_session.start_time* and *ts*
-                    last_hb = session.exec(
-                        select(HeartbeatEvent)
-                        .where(
-                            HeartbeatEvent.username == tracker_settings.user,
-                            HeartbeatEvent.timestamp > open_session.start_time,
-                            HeartbeatEvent.timestamp < ts,
-                        )
-                        .order_by(HeartbeatEvent.timestamp.desc())
-                    ).first()
-                    end_ts = last_hb.timestamp if last_hb else ts
-                    open_session.end_time = end_ts
-                    open_session.end_reason = label
-                    session.add(open_session)
-            # Commit any pending changes (if we made modifications)
-            session.commit()
+                .scalar_subquery()
+            )
+            session.exec(
+                update(WorkingSession)
+                .where(
+                    WorkingSession.id
+                    == select(latest_open.id)
+                    .where(latest_open.username == user, latest_open.end_time.is_(None))
+                    .order_by(latest_open.start_time.desc())
+                    .limit(1)
+                    .scalar_subquery()
+                )
+                .values(end_time=func.coalesce(last_hb_ts, ts), end_reason=label),
+                execution_options=_NO_SYNC,
+            )
+
+    @staticmethod
+    def _publish_open_session_state(session: Session) -> None:
+        EventStore._has_open_session = session.info["has_open_session"]
 
     @staticmethod
     def log_activity(label: str, timestamp: datetime | None = None) -> None:
@@ -110,15 +171,16 @@ class EventStore:
         ts = timestamp or datetime.now()
 
         EventStore._insert(
-            ActivityEvent(
-                username=tracker_settings.user,
+            ActivityEvent,
+            dict(
+                username=_user(),
                 timestamp=ts,
                 event=label,
-            )
+            ),
         )
 
         # Update working-session state once the activity row is recorded
-        EventStore._handle_working_session(label, ts)
+        _writer.submit(partial(EventStore._handle_working_session, label=label, ts=ts))
 
     @staticmethod
     def heartbeat(timestamp: datetime | None = None) -> None:
@@ -131,10 +193,26 @@ class EventStore:
         """
         ts = timestamp or datetime.now()
         EventStore._insert(
-            HeartbeatEvent(
-                username=tracker_settings.user,
+            HeartbeatEvent,
+            dict(
+                username=_user(),
                 timestamp=ts,
-            )
+            ),
+        )
+
+    @staticmethod
+    def log_window_event_range(window_title: str, start_time: datetime, end_time: datetime) -> None:
+        """Write a *WindowEvent* row for a focus span from *start_time* to *end_time*."""
+        EventStore._insert(
+            WindowEvent,
+            dict(
+                username=_user(),
+                timestamp=start_time,
+                window_title=window_title,
+                duration=(end_time - start_time).total_seconds(),
+                start_time=start_time,
+                end_time=end_time,
+            ),
         )
 
     @staticmethod
@@ -147,6 +225,7 @@ class EventStore:
 
         If start_time and end_time are provided, they take precedence and duration
         is calculated from them. Otherwise, falls back to timestamp + duration.
+        Callers that always have both ends should use :meth:`log_window_event_range`.
 
         Args:
             window_title: Title of the focused window
@@ -155,27 +234,20 @@ class EventStore:
             start_time: Explicit start timestamp of window focus
             end_time: Explicit end timestamp of window focus
         """
-        # Determine the actual start and end times to use
         if start_time is not None and end_time is not None:
-            actual_start_time = start_time
-            actual_end_time = end_time
-            actual_duration = (end_time - start_time).total_seconds()
-            # Use start_time for timestamp field for consistency
-            ts = start_time
-        else:
-            # Fall back to legacy parameters
-            ts = timestamp or datetime.now()
-            actual_start_time = ts
-            actual_end_time = ts + timedelta(seconds=duration) if duration > 0 else None
-            actual_duration = duration
+            EventStore.log_window_event_range(window_title, start_time, end_time)
+            return
 
+        # Legacy parameters
+        ts = timestamp or datetime.now()
         EventStore._insert(
-            WindowEvent(
-                username=tracker_settings.user,
+            WindowEvent,
+            dict(
+                username=_user(),
                 timestamp=ts,
                 window_title=window_title,
-                duration=actual_duration,
-                start_time=actual_start_time,
-                end_time=actual_end_time,
-            )
+                duration=duration,
+                start_time=ts,
+                end_time=ts + timedelta(seconds=duration) if duration > 0 else None,
+            ),
         )
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import cache
+from typing import Callable, Iterator
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DataError, IntegrityError, InterfaceError, OperationalError
+from sqlmodel import Session, SQLModel
+
+from tracker.config.db_settings import get_db_settings
+from tracker.db.connect import get_session
+
+Job = Callable[[Session], None]
+
+# Errors caused by the rows themselves: retrying them one by one isolates the bad one.
+_DATA_ERRORS = (IntegrityError, DataError)
+# May mean the server is unreachable (down, restarting, network gone), but psycopg
+# also raises OperationalError for statements the server rejects, e.g. an index row
+# that is too large (54000), a full disk or a cancelled query; see _is_disconnect.
+_CONNECTION_ERRORS = (OperationalError, InterfaceError)
+
+# Scoped to the writer's own transaction; see DBSettings.PG_WRITER_ASYNC_COMMIT.
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+
+def _is_disconnect(exc: Exception) -> bool:
+    """Return whether *exc* means the connection was lost, so the batch is worth retrying.
+
+    That is the case when SQLAlchemy invalidated the connection, when the SQLSTATE is
+    in class 08 (connection exception), or when there is no SQLSTATE at all, i.e.
+    the error came from the client rather than the server.
+    """
+    if not isinstance(exc, _CONNECTION_ERRORS):
+        return False
+    if isinstance(exc, InterfaceError) or exc.connection_invalidated:
+        return True
+    sqlstate = getattr(exc.orig, "sqlstate", None)
+    return sqlstate is None or sqlstate.startswith("08")
+
+
+@cache
+def _insert_for(model: type[SQLModel]):
+    """Return the (reused) ``INSERT ... ON CONFLICT DO NOTHING`` for *model*'s table.
+
+    Rows that duplicate an existing one under the table's unique constraint
+    (e.g. an event re-submitted after a retry) are skipped by Postgres instead of
+    failing the whole batch.
+
+    Reusing one construct per table also reuses its cache key, so SQLAlchemy's
+    compiled cache hands back the same compiled SQL without re-analysing it.
+    """
+    return insert(model).on_conflict_do_nothing()
+
+
+@contextmanager
+def _prepare_immediately(session: Session) -> Iterator[None]:
+    """Have psycopg prepare statements server-side from their first execution.
+
+    psycopg normally prepares a statement only after it has run five times on a
+    connection. The writer runs the same few INSERT/UPDATEs all day, so it lowers
+    the threshold of its connection to 0 for the transaction and restores it
+    before the connection goes back to the pool; other sessions are unaffected.
+    Connections with preparation disabled (``PG_PREPARE_STATEMENTS=false``) are
+    left alone.
+    """
+    raw = session.connection().connection.dbapi_connection
+    saved = getattr(raw, "prepare_threshold", None)
+    if saved is None:
+        yield
+        return
+    raw.prepare_threshold = 0
+    try:
+        yield
+    finally:
+        raw.prepare_threshold = saved
+
+
+class EventWriter:
+    """Persist event rows on a background thread in batched transactions.
+
+    Producers call :meth:`put` with a table model and a dict of column values,
+    which only appends to a queue; no ORM instance is ever built. The writer thread
+    collects rows until *max_batch* are pending or *max_delay* seconds have passed
+    since the first one arrived. Then it writes every table's rows with one
+    executemany ``INSERT``, runs any queued jobs (callables taking the session)
+    in submission order, and commits once for the whole batch.
+
+    While the database is unreachable the batch is kept and retried with
+    exponential backoff (*retry_delay* doubling up to *max_retry_delay*), at most
+    *max_attempts* times; new items queue up behind it, at most *max_queue* of
+    them, after which further items are dropped with a warning rather than
+    growing without bound. Any other database error makes the writer retry the
+    batch row by row, so that just the offending row is lost.
+
+    The thread starts on the first :meth:`put`. It is stopped, after writing
+    whatever is still queued, by :meth:`close`, which is also registered with
+    :mod:`atexit`. Items put after :meth:`close` are dropped with a warning.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 256,
+        max_delay: float = 0.2,
+        max_queue: int = 10_000,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 30.0,
+        max_attempts: int = 20,
+    ) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_attempts = max_attempts
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        atexit.register(self.close, 5.0)
+
+    def put(self, model: type[SQLModel], values: dict) -> None:
+        """Queue a *model* row with column *values*; returns without touching the database."""
+        self._enqueue((model, values), model.__name__)
+
+    def submit(self, job: Job) -> None:
+        """Queue *job* to run on the writer thread with the batch's session.
+
+        Jobs run after the batch's rows are inserted and must not commit; the
+        writer commits once the whole batch has been applied.
+        """
+        self._enqueue(job, "job")
+
+    def _enqueue(self, item: tuple[type[SQLModel], dict] | Job, what: str) -> None:
+        if self._stopping.is_set():
+            logger.warning("Event writer is closed; dropping {}", what)
+            return
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.warning("Event queue full ({} items); dropping {}", self._queue.maxsize, what)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write the rows still queued and stop the writer thread.
+
+        The writer stays closed: later :meth:`put` and :meth:`submit` calls drop
+        their items instead of starting a new thread.
+        """
+        with self._lock:
+            self._stopping.set()  # refuse new items and cut any retry backoff short
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass  # the writer is stuck on an unreachable database; the join below times out too
+        thread.join(None if deadline is None else max(deadline - time.monotonic(), 0.0))
+        if thread.is_alive():
+            logger.warning(
+                "Event writer did not finish within {}s; {} queued items are lost", timeout, self._queue.qsize()
+            )
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stopping.is_set():
+                return
+            thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+            thread.start()
+            self._thread = thread
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            batch: list[tuple[type[SQLModel], dict] | Job] = []
+            stop = False
+
+            item = get()
+            deadline = time.monotonic() + self.max_delay
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _transact(self, apply: Job) -> None:
+        """Run *apply* in one transaction and commit it.
+
+        Unless ``PG_WRITER_ASYNC_COMMIT`` is off, the commit does not wait for
+        the WAL flush. Statements are prepared on first use, see
+        :func:`_prepare_immediately`.
+
+        A lost connection is retried with backoff, up to *max_attempts* attempts
+        and not at all once :meth:`close` has been called; then the last attempt's
+        error is raised. Any other error is raised immediately.
+        """
+        async_commit = get_db_settings().PG_WRITER_ASYNC_COMMIT
+        delay = self.retry_delay
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with get_session() as session:
+                    if async_commit:
+                        session.exec(_ASYNC_COMMIT)
+                    with _prepare_immediately(session):
+                        apply(session)
+                        session.commit()
+                return
+            except _CONNECTION_ERRORS as exc:
+                if not _is_disconnect(exc) or self._stopping.is_set() or attempt >= self.max_attempts:
+                    raise
+                logger.warning("Database unavailable ({}); retrying in {:.1f}s", exc.orig or exc, delay)
+                self._stopping.wait(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+
+    def _write(self, batch: list[tuple[type[SQLModel], dict] | Job]) -> None:
+        by_model: dict[type[SQLModel], list[dict]] = {}
+        jobs: list[Job] = []
+        for item in batch:
+            if type(item) is tuple:
+                model, values = item
+                by_model.setdefault(model, []).append(values)
+            else:
+                jobs.append(item)
+
+        def apply_batch(session: Session) -> None:
+            for model, params in by_model.items():
+                session.exec(_insert_for(model), params=params)
+            for job in jobs:
+                job(session)
+
+        try:
+            self._transact(apply_batch)
+            return
+        except (*_DATA_ERRORS, *_CONNECTION_ERRORS) as exc:
+            if _is_disconnect(exc):
+                logger.error("Database unavailable; dropping {} items ({})", len(batch), exc.orig or exc)
+                return
+            logger.warning("Batched write of {} items failed ({}); retrying one by one", len(batch), exc.orig or exc)
+        except Exception:
+            logger.exception("Dropping batch of {} items", len(batch))
+            return
+
+        # One bad row (e.g. a value the column rejects, or a title too long for
+        # its index) must not take the rest of the batch with it, so fall back
+        # to a transaction per row and per job.
+        for model, params in by_model.items():
+            insert_stmt = _insert_for(model)
+            for values in params:
+                try:
+                    self._transact(lambda session: session.exec(insert_stmt, params=values))
+                except Exception:
+                    logger.exception("Dropping {} row {}", model.__name__, values)
+        for job in jobs:
+            try:
+                self._transact(job)
+            except Exception:
+                logger.exception("Dropping job {}", job)
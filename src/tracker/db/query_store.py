@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Sequence
+from typing import Any, Iterable, List, Mapping, Sequence
 
-from sqlalchemy import text
-from sqlmodel import select
+from sqlalchemy import delete, text
+from sqlmodel import Session, select
 
 from tracker.db.connect import get_session
-from tracker.tables.adk_query_table import AdkQuery
+from tracker.tables.adk_query_table import AdkQuery, AdkQueryTag
 
 
 class QueryStore:
@@ -37,6 +37,27 @@ class QueryStore:
         Returns:
             The *AdkQuery* instance that was written to the database.
         """
+        with get_session() as session:
+            row = QueryStore._upsert(session, name, query, tags)
+            session.commit()
+            return row
+
+    @staticmethod
+    def save_queries(queries: Iterable[Mapping[str, Any]]) -> None:
+        """Create or update several saved queries in a single transaction.
+
+        Each item holds the keyword arguments of :meth:`save_query` (*name*,
+        *query* and optionally *tags*).  All rows share one session and one
+        commit instead of paying a round-trip and commit per query.
+        """
+        with get_session() as session:
+            for q in queries:
+                QueryStore._upsert(session, q["name"], q["query"], q.get("tags"))
+            session.commit()
+
+    @staticmethod
+    def _upsert(session: Session, name: str, query: str, tags: str | Sequence[str] | None) -> AdkQuery:
+        """Stage the insert/update of query *name* on *session* without committing."""
         # Normalise *tags* to a comma-separated string for storage
         if tags is None:
             tag_str: str | None = None
@@ -46,22 +67,26 @@ class QueryStore:
         else:
             tag_str = ",".join(str(t).strip() for t in tags)
 
-        with get_session() as session:
-            existing = session.exec(select(AdkQuery).where(AdkQuery.name == name)).first()
-
-            if existing:
-                existing.query = query
-                existing.tags = tag_str
-                session.add(existing)
-                session.commit()
-                session.refresh(existing)
-                return existing
-            else:
-                new_row = AdkQuery(name=name, query=query, tags=tag_str)
-                session.add(new_row)
-                session.commit()
-                session.refresh(new_row)
-                return new_row
+        # Sessions do not autoflush: write out what earlier upserts in this
+        # session staged, so the lookup and the tag DELETE below see it.
+        session.flush()
+        existing = session.exec(select(AdkQuery).where(AdkQuery.name == name)).first()
+
+        if existing:
+            existing.query = query
+            existing.tags = tag_str
+            session.add(existing)
+            row = existing
+        else:
+            row = AdkQuery(name=name, query=query, tags=tag_str)
+            session.add(row)
+            session.flush()  # assigns row.id for the tag rows below
+
+        # Keep the normalised tag rows in step with *tags*
+        session.exec(delete(AdkQueryTag).where(AdkQueryTag.query_id == row.id))
+        tag_set = {t.strip().lower() for t in tag_str.split(",")} - {""} if tag_str else set()
+        session.add_all(AdkQueryTag(query_id=row.id, tag=t) for t in sorted(tag_set))
+        return row
 
     # ------------------------------------------------------------------
     # Retrieval helpers
@@ -69,19 +94,18 @@ class QueryStore:
     @staticmethod
     def _tags_filter(tag_list: Sequence[str]):
         """Build a *where* clause that matches any of *tag_list* (case-insensitive)."""
-        # Use ILIKE with wildcards – this keeps it simple without requiring FTS.
-        from sqlalchemy import or_, func
-
-        filters = [func.lower(AdkQuery.tags).ilike(f"%{t.lower()}%") for t in tag_list]
-        return or_(*filters)
+        # Whole-tag match through the indexed tag table ("foo" no longer matches "foobar").
+        wanted = [t.strip().lower() for t in tag_list]
+        return AdkQuery.id.in_(select(AdkQueryTag.query_id).where(AdkQueryTag.tag.in_(wanted)))
 
     @staticmethod
     def find_queries(name: str | None = None, tags: Sequence[str] | None = None) -> List[AdkQuery]:
         """Search saved queries by *name* and/or *tags*.
 
         The search is *case-insensitive* and matches partial names ("report" will
-        match "Weekly Report").  Tag filters are applied with **OR** semantics –
-        a query is returned if *any* of the supplied tags match.
+        match "Weekly Report").  Tag filters compare whole tags and are applied
+        with **OR** semantics – a query is returned if *any* of the supplied
+        tags match.
         """
         stmt = select(AdkQuery)
 
@@ -113,9 +137,10 @@ class QueryStore:
             ValueError: If no query with the specified *name* exists.
         """
         with get_session() as session:
-            row = session.exec(select(AdkQuery).where(AdkQuery.name == name)).first()
-            if row is None:
+            # Only the SQL text is needed – skip hydrating a full *AdkQuery*.
+            query = session.exec(select(AdkQuery.query).where(AdkQuery.name == name)).first()
+            if query is None:
                 raise ValueError(f"No saved query found with name '{name}'.")
 
-            result = session.exec(text(row.query)).mappings().all()
-            return [dict(r) for r in result]
\ No newline at end of file
+            result = session.exec(text(query)).mappings().all()
+            return [dict(r) for r in result]
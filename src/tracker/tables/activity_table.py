@@ -18,9 +18,11 @@ class ActivityEventType(StrEnum):
 class ActivityEvent(SQLModel, table=True):
     """Database model describing a single activity event."""
 
+    # The unique index leads with (username, timestamp), so it also serves "events
+    # of user X in a time range"; separate per-column indexes would only add writes.
     __table_args__ = (UniqueConstraint("username", "timestamp", "event", name="ux_activity_identity"),)
 
     id: int | None = Field(default=None, primary_key=True)
-    username: str = Field(index=True)
-    timestamp: datetime = Field(index=True)
-    event: str = Field(index=True)
+    username: str
+    timestamp: datetime
+    event: str  # not indexed: only a handful of distinct labels
@@ -15,4 +15,12 @@ class AdkQuery(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     name: str = Field(index=True, description="Human-readable name/title of the saved query")
     query: str = Field(description="Raw ADK query string")
-    tags: str | None = Field(default=None, index=True, description="Comma-separated list of tags for quick lookup")
\ No newline at end of file
+    tags: str | None = Field(default=None, description="Comma-separated list of tags, as entered")
+
+
+class AdkQueryTag(SQLModel, table=True):
+    """One lower-cased tag of an *AdkQuery*; lets tag searches use an index
+    instead of pattern-matching the comma-separated *tags* column."""
+
+    query_id: int = Field(foreign_key="adkquery.id", primary_key=True)
+    tag: str = Field(primary_key=True, index=True)
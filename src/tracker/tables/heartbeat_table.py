@@ -1,12 +1,16 @@
 from datetime import datetime
 
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Index, SQLModel
 
 
 class HeartbeatEvent(SQLModel, table=True):
     """Database model for periodic heartbeat pings indicating the tracker is alive."""
 
+    # Heartbeats are only ever looked up per user and time range (the last beat
+    # of a session), which is a single seek + range scan on this index.
+    __table_args__ = (Index("ix_heartbeat_user_ts", "username", "timestamp"),)
+
     id: int | None = Field(default=None, primary_key=True)
-    username: str = Field(index=True, description="System user that emitted the heartbeat")
-    timestamp: datetime = Field(index=True, description="Timestamp of the heartbeat event")
+    username: str = Field(description="System user that emitted the heartbeat")
+    timestamp: datetime = Field(description="Timestamp of the heartbeat event")
     status: str = Field(default="Alive", description="Heartbeat status text")
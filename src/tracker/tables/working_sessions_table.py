@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlmodel import Field, SQLModel, UniqueConstraint
+from sqlalchemy import text
+from sqlmodel import Field, Index, SQLModel, UniqueConstraint
 
 
 class WorkingSession(SQLModel, table=True):
@@ -9,7 +10,18 @@ class WorkingSession(SQLModel, table=True):
     the end.  The *end_time* column is ``NULL`` while the session is still
     ongoing and filled in once the end is known."""
 
-    __table_args__ = (UniqueConstraint("username", "start_time", name="ux_working_session_identity"),)
+    __table_args__ = (
+        UniqueConstraint("username", "start_time", name="ux_working_session_identity"),
+        # Open sessions only: finding a user's open session is a single index seek
+        # no matter how many closed sessions have accumulated.
+        Index(
+            "ix_working_session_user_open",
+            "username",
+            "start_time",
+            postgresql_where=text("end_time IS NULL"),
+            sqlite_where=text("end_time IS NULL"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     username: str = Field(index=True)
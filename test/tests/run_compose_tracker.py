@@ -16,6 +16,7 @@ by exporting them before invoking the script.
 from __future__ import annotations
 
 import os
+import random
 import shutil
 import signal
 import subprocess
@@ -48,6 +49,7 @@ _load_env_file(TEST_ENV_PATH)
 
 RUN_TIME = int(os.environ.get("TRACKER_TEST_RUN_TIME", "10"))
 PG_TIMEOUT = int(os.environ.get("TRACKER_PG_TIMEOUT", "30"))
+SHUTDOWN_TIMEOUT = int(os.environ.get("TRACKER_SHUTDOWN_TIMEOUT", "5"))
 
 
 def _run(cmd: list[str] | str, *, check: bool = True) -> None:
@@ -85,6 +87,19 @@ def _wait_for_postgres(host: str, port: str, timeout: int = PG_TIMEOUT) -> None:
 
     dsn = f"postgresql://{user}:{password}@{host}:{port}/{database}?connect_timeout=1"
 
+    # Fast path: a host-side pg_isready waits server-side in a single call
+    # instead of us opening one rejected connection after another.
+    if shutil.which("pg_isready"):
+        result = subprocess.run(
+            ["pg_isready", "-h", host, "-p", str(port), "-t", str(min(timeout, 10))], capture_output=True
+        )
+        if result.returncode == 0:
+            print("Postgres is ready!", flush=True)
+            return
+
+    # Exponential backoff with jitter (0.1s → 0.2s → 0.4s … capped at 2s) so a
+    # cold start is picked up quickly without hammering the server every second.
+    delay = 0.1
     while True:
         # ------------------------------------------------------------------
         # Prefer a *direct* connection attempt via psycopg as this avoids the
@@ -109,10 +124,12 @@ def _wait_for_postgres(host: str, port: str, timeout: int = PG_TIMEOUT) -> None:
                 print("Postgres is ready!", flush=True)
                 return
 
-        if time.monotonic() - start > timeout:
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
             raise RuntimeError("Postgres did not become ready within the allotted time")
 
-        time.sleep(1)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2 + random.uniform(0, 0.1), 2.0)
 
 
 # ---------------------------------------------------------------------------
@@ -145,11 +162,25 @@ def main() -> None:
     tracker_proc = subprocess.Popen([sys.executable, "-c", tracker_code], cwd=PROJECT_ROOT, env=env)
 
     try:
-        time.sleep(RUN_TIME)
-    finally:
+        # Returns as soon as the tracker exits, so an early crash is not
+        # hidden behind the full RUN_TIME sleep.
+        returncode = tracker_proc.wait(timeout=RUN_TIME)
+        print(f"\nActivityTracker exited early with return code {returncode}.")
+        if returncode != 0:
+            sys.exit(returncode)
+    except subprocess.TimeoutExpired:
         tracker_proc.send_signal(signal.SIGINT)
-        tracker_proc.wait()
+        try:
+            tracker_proc.wait(timeout=SHUTDOWN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            print(f"\nActivityTracker ignored SIGINT for {SHUTDOWN_TIMEOUT}s; killing it.")
+            tracker_proc.kill()
+            tracker_proc.wait()
         print("\nActivityTracker finished the short test run.")
+    finally:
+        if tracker_proc.poll() is None:  # e.g. KeyboardInterrupt while waiting
+            tracker_proc.kill()
+            tracker_proc.wait()
 
 
 if __name__ == "__main__":
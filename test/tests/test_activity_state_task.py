@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pytest
+
+from tracker.core.activity_state_tracker.activity_state_task import ActivityStateTask
+from tracker.tables.activity_table import ActivityEventType as E
+
+
+class FakeLockDetector:
+    def __init__(self) -> None:
+        self.locked = False
+
+    def is_locked(self) -> bool:
+        return self.locked
+
+
+class FakeIdleDetector:
+    def __init__(self) -> None:
+        self.idle = 0.0
+        self.calls = 0
+
+    def seconds_idle(self) -> float:
+        self.calls += 1
+        return self.idle
+
+
+@pytest.fixture
+def logged(monkeypatch) -> list[E]:
+    events: list[E] = []
+    monkeypatch.setattr(
+        ActivityStateTask, "_log_activity", staticmethod(lambda state, timestamp: events.append(state))
+    )
+    return events
+
+
+def _task(**kwargs) -> tuple[ActivityStateTask, FakeLockDetector, FakeIdleDetector]:
+    lock, idle = FakeLockDetector(), FakeIdleDetector()
+    task = ActivityStateTask(_lock_detector=lock, _idle_detector=idle, **kwargs)
+    return task, lock, idle
+
+
+def test_first_tick_logs_the_initial_state(logged):
+    task, _, _ = _task()
+    assert task.tick(0.0) == (False, False)
+    assert logged == [E.ACTIVE]
+
+
+def test_lock_and_unlock_transitions(logged):
+    task, lock, _ = _task()
+    task.tick(0.0)
+    lock.locked = True
+    assert task.tick(1.0) == (True, False)
+    lock.locked = False
+    assert task.tick(2.0) == (False, False)
+    assert logged == [E.ACTIVE, E.SCREEN_LOCKED, E.SCREEN_UNLOCKED, E.ACTIVE]
+
+
+def test_poll_period_backs_off_while_nothing_changes(logged):
+    task, lock, _ = _task(period=0.1, max_backoff=8)
+    periods = []
+    for now in range(5):
+        task.tick(float(now))
+        periods.append(task.period)
+    assert periods == pytest.approx([0.1, 0.2, 0.4, 0.8, 0.8])
+
+    lock.locked = True
+    task.tick(5.0)
+    assert task.period == pytest.approx(0.1)
+
+
+def test_idle_probe_is_skipped_until_the_threshold_could_be_reached(logged):
+    task, _, idle = _task(idle_threshold=150)
+    idle.idle = 30.0
+    task.tick(0.0)
+    assert idle.calls == 1
+
+    # With 30 s idle at t=0 the user cannot be idle before t=120.
+    task.tick(60.0)
+    task.tick(119.0)
+    assert idle.calls == 1
+
+    idle.idle = 150.0
+    assert task.tick(120.0) == (False, True)
+    assert idle.calls == 2
+    assert logged == [E.ACTIVE, E.INACTIVE]
+
+
+def test_idle_user_is_probed_every_tick(logged):
+    task, _, idle = _task(idle_threshold=150)
+    idle.idle = 200.0
+    task.tick(0.0)
+    task.tick(1.0)
+    idle.idle = 0.0
+    assert task.tick(2.0) == (False, False)
+    assert idle.calls == 3
+    assert logged == [E.INACTIVE, E.ACTIVE]
+
+
+def test_locked_screen_skips_the_idle_probe(logged):
+    task, lock, idle = _task()
+    lock.locked = True
+    task.tick(0.0)
+    task.tick(1.0)
+    assert idle.calls == 0
+    assert logged == [E.SCREEN_LOCKED]
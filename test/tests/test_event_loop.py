@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+from tracker.core import event_loop
+from tracker.core.event_loop import EventLoop
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test (or the fake selector) advances it."""
+
+    def __init__(self, start: float = 100.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSelector:
+    """Selector whose ``select`` sleeps on the fake clock and never reports a signal."""
+
+    clock: FakeClock
+
+    def register(self, *args) -> None:
+        pass
+
+    def select(self, timeout: float) -> list:
+        self.clock.now += timeout
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class RecordingTask:
+    def __init__(self, loop_ref: list, period: float, ticks: int, busy: float = 0.0, clock: FakeClock | None = None):
+        self.period = period
+        self.seen: list[float] = []
+        self._loop_ref = loop_ref
+        self._ticks = ticks
+        self._busy = busy
+        self._clock = clock
+
+    def tick(self, now: float) -> None:
+        self.seen.append(now)
+        if self._clock is not None and len(self.seen) == 1:
+            self._clock.now += self._busy  # the first tick overruns its slot
+        if len(self.seen) >= self._ticks:
+            self._loop_ref[0].stop()
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    FakeSelector.clock = fake
+    monkeypatch.setattr(event_loop.time, "monotonic", fake)
+    monkeypatch.setattr(event_loop.selectors, "DefaultSelector", FakeSelector)
+    return fake
+
+
+def _run(*tasks) -> None:
+    loop_ref: list = []
+    for task in tasks:
+        task._loop_ref = loop_ref
+    loop = EventLoop(tasks)
+    loop_ref.append(loop)
+    loop.run()
+
+
+def test_ticks_on_absolute_deadlines(clock):
+    task = RecordingTask([], period=1.5, ticks=4)
+    _run(task)
+    assert task.seen == [100.0, 101.5, 103.0, 104.5]
+
+
+def test_tasks_keep_their_own_periods(clock):
+    fast = RecordingTask([], period=1.0, ticks=5)
+    slow = RecordingTask([], period=2.0, ticks=99)
+    _run(fast, slow)
+    assert fast.seen == [100.0, 101.0, 102.0, 103.0, 104.0]
+    # Ties go to the earlier task: at 104 the fast task ticks first and stops the loop.
+    assert slow.seen == [100.0, 102.0]
+
+
+def test_missed_slots_are_skipped_not_replayed(clock):
+    task = RecordingTask([], period=1.0, ticks=3, busy=3.5, clock=clock)
+    _run(task)
+    # 101, 102 and 103 were missed while the first tick ran; the next tick lands
+    # on the next slot of the original grid instead of firing three times.
+    assert task.seen == [100.0, 104.0, 105.0]
+
+
+def test_period_read_after_each_tick(clock):
+    task = RecordingTask([], period=1.0, ticks=3)
+    original_tick = task.tick
+
+    def tick(now: float) -> None:
+        original_tick(now)
+        task.period *= 2  # e.g. ActivityStateTask backing off
+
+    task.tick = tick
+    _run(task)
+    assert task.seen == [100.0, 102.0, 106.0]
+
+
+@pytest.mark.parametrize("period", [0, -1.0])
+def test_rejects_non_positive_periods(period):
+    task = RecordingTask([], period=period, ticks=1)
+    with pytest.raises(ValueError, match="period must be > 0"):
+        EventLoop([task])
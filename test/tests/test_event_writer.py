@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import psycopg
+import psycopg.errors
+import pytest
+from sqlalchemy.exc import IntegrityError, InterfaceError, OperationalError
+
+from tracker.db import event_writer
+from tracker.db.event_writer import EventWriter, _is_disconnect
+from tracker.tables.heartbeat_table import HeartbeatEvent
+
+
+def _wrap(orig: Exception, cls=OperationalError, **kwargs):
+    """Wrap a psycopg error the way SQLAlchemy raises it."""
+    return cls("INSERT ...", {}, orig, **kwargs)
+
+
+class FakeSession:
+    def __init__(self, db: FakeDatabase) -> None:
+        self._db = db
+        self._pending: list = []
+        self._raw = SimpleNamespace(prepare_threshold=5)
+        db.connections.append(self._raw)
+
+    def connection(self):
+        return SimpleNamespace(connection=SimpleNamespace(dbapi_connection=self._raw))
+
+    def exec(self, statement, params=None):
+        self._db.executed.append(params)
+        if self._db.failures:
+            error = self._db.failures.pop(0)
+            if error is not None:
+                raise error
+        self._pending.append(params)
+
+    def commit(self) -> None:
+        self._db.committed.extend(self._pending)
+        self._db.thresholds.append(self._raw.prepare_threshold)
+
+
+class FakeDatabase:
+    """Stands in for ``get_session``; ``failures`` lists what each ``exec`` raises (None: succeeds)."""
+
+    def __init__(self) -> None:
+        self.failures: list[Exception | None] = []
+        self.sessions = 0
+        self.executed: list = []
+        self.committed: list = []
+        self.thresholds: list = []
+        self.connections: list = []
+
+    @contextmanager
+    def get_session(self):
+        self.sessions += 1
+        yield FakeSession(self)
+
+
+@pytest.fixture
+def db(monkeypatch) -> FakeDatabase:
+    fake = FakeDatabase()
+    monkeypatch.setattr(event_writer, "get_session", fake.get_session)
+    monkeypatch.setattr(event_writer, "get_db_settings", lambda: SimpleNamespace(PG_WRITER_ASYNC_COMMIT=False))
+    return fake
+
+
+def _rows(n: int) -> list:
+    return [(HeartbeatEvent, {"n": i}) for i in range(n)]
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (_wrap(psycopg.errors.ConnectionFailure("server closed the connection")), True),
+        (_wrap(psycopg.OperationalError("connection refused")), True),  # no SQLSTATE: client side
+        (_wrap(psycopg.errors.AdminShutdown("terminating"), connection_invalidated=True), True),
+        (_wrap(psycopg.InterfaceError("the connection is closed"), InterfaceError), True),
+        (_wrap(psycopg.errors.ProgramLimitExceeded("index row size exceeds maximum")), False),
+        (_wrap(psycopg.errors.DiskFull("could not extend file")), False),
+        (_wrap(psycopg.errors.QueryCanceled("canceling statement")), False),
+        (_wrap(psycopg.errors.UniqueViolation("duplicate key"), IntegrityError), False),
+    ],
+)
+def test_is_disconnect(exc, expected):
+    assert _is_disconnect(exc) is expected
+
+
+def test_rejected_row_falls_back_to_one_row_per_transaction(db):
+    too_big = _wrap(psycopg.errors.ProgramLimitExceeded("index row size exceeds maximum"))
+    # The batch INSERT fails, then so does the retry of the second row alone.
+    db.failures = [too_big, None, too_big, None]
+    writer = EventWriter(retry_delay=0)
+    writer._write(_rows(3))
+
+    assert db.sessions == 4  # the batch, then the three rows on their own; no retry loop
+    assert db.committed == [{"n": 0}, {"n": 2}]
+
+
+def test_lost_connection_is_retried_with_the_whole_batch(db):
+    lost = _wrap(psycopg.errors.ConnectionFailure("server closed the connection"))
+    db.failures = [lost, lost]
+    writer = EventWriter(retry_delay=0)
+    writer._write(_rows(3))
+
+    assert db.sessions == 3
+    assert db.committed == [[{"n": 0}, {"n": 1}, {"n": 2}]]
+
+
+def test_lost_connection_gives_up_after_max_attempts(db):
+    lost = _wrap(psycopg.errors.ConnectionFailure("server closed the connection"))
+    db.failures = [lost] * 10
+    writer = EventWriter(retry_delay=0, max_attempts=3)
+    writer._write(_rows(2))
+
+    assert db.sessions == 3  # dropped, not sent through the row-by-row fallback
+    assert db.committed == []
+
+
+def test_no_retries_once_closing(db):
+    lost = _wrap(psycopg.errors.ConnectionFailure("server closed the connection"))
+    db.failures = [lost] * 10
+    writer = EventWriter(retry_delay=0)
+    writer._stopping.set()
+    writer._write(_rows(2))
+
+    assert db.sessions == 1
+
+
+def test_statements_are_prepared_immediately_and_threshold_restored(db):
+    writer = EventWriter()
+    writer._write(_rows(1))
+    assert db.thresholds == [0]  # as seen at commit time
+    assert db.connections[0].prepare_threshold == 5  # back to the pool as it was
+
+
+def test_put_after_close_is_dropped(db):
+    writer = EventWriter()
+    writer.put(HeartbeatEvent, {"n": 0})
+    writer.close(timeout=5)
+    assert db.committed == [[{"n": 0}]]
+
+    writer.put(HeartbeatEvent, {"n": 1})
+    assert writer._thread is None
+    assert writer._queue.empty()
@@ -19,9 +19,6 @@ import argparse
 import sys
 from typing import Any, Dict
 
-from tracker.db.connect import get_session
-from tracker.tables.people_table import Person_Usernames
-
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:  # noqa: D401
     """Parse command-line arguments."""
@@ -38,6 +35,13 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:  # noqa: D4
 def main(argv: list[str] | None = None) -> None:
     ns = parse_args(argv)
 
+    # Deferred so ``--help`` and argument errors return immediately without
+    # importing SQLAlchemy and every table model.
+    from sqlalchemy import insert
+
+    from tracker.db.connect import get_session
+    from tracker.tables.people_table import Person_Usernames
+
     # Build the new *Person* row dynamically to avoid passing None for every field
     fields: Dict[str, Any] = {
         "full_name": ns.full_name,
@@ -50,14 +54,19 @@ def main(argv: list[str] | None = None) -> None:
     # Remove keys with *None* values so SQL defaults can apply
     person_kwargs = {k: v for k, v in fields.items() if v is not None}
 
-    person = Person_Usernames(**person_kwargs)
+    # A single INSERT … RETURNING gives us the generated key without the ORM
+    # flush and the follow-up SELECT that ``session.refresh`` would issue.
+    stmt = (
+        insert(Person_Usernames)
+        .values(**person_kwargs)
+        .returning(Person_Usernames.person_id, Person_Usernames.full_name)
+    )
 
     with get_session() as session:
-        session.add(person)
+        person_id, full_name = session.exec(stmt).one()
         session.commit()
-        session.refresh(person)
 
-    print(f"✔ Added person_id={person.person_id} – {person.full_name}")
+    print(f"✔ Added person_id={person_id} – {full_name}")
 
 
 if __name__ == "__main__":